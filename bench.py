@@ -0,0 +1,326 @@
+"""
+Load test for server.py against a local PostgreSQL database.
+
+    python bench.py postgresql://localhost/research_bench --drop-existing --students 5000 --clients 8
+
+Seeds the database with a synthetic dataset from datagen.py (existing tables are
+dropped first, so point it at a scratch database and confirm with
+--drop-existing), serves the app in-process and drives every route with
+concurrent clients for a fixed duration. Latency percentiles,
+throughput and SQL queries per request (read from the Server-Timing header) are
+printed per route and saved as JSON under bench-results/, named after the
+current commit, so runs can be compared across commits.
+"""
+import os
+import re
+import json
+import time
+import math
+import random
+import datetime
+import threading
+import subprocess
+import http.client
+from urllib.parse import urlencode
+
+import click
+
+from datagen import SyntheticDataset, load, import_server, check_target, EPOCH, LAST_NAMES, TOPICS, LEVELS
+
+
+#SCENARIOS
+# Each scenario returns (method, path, form data or None) for one request.
+# Weights approximate a read-heavy mix; every route gets some traffic.
+def load_scenario_pools(server, seed, sample_size=2000):
+    """
+    A sample of existing rows to build requests from. Rows are ordered by a
+    hash of their key and the seed, so the same seed and data give the same
+    sample on every run.
+    """
+    queries = {
+        'students': ("SELECT student_id, name, email_addr, academic_level, year_of_study, staff_id "
+                     "FROM Student", "student_id"),
+        'professors': ("SELECT staff_id, name, email_addr, research_focus FROM Professor", "staff_id"),
+        'projects': ("SELECT project_id, title, abstract, status, start_date FROM Project", "project_id"),
+        'skills': ("SELECT skill_id FROM Skill", "skill_id"),
+        'departments': ("SELECT dept_id, dept_name, university_name FROM Department",
+                        "dept_id || university_name"),
+    }
+    pools = {}
+    with server.engine.connect() as conn:
+        for name, (sql, key) in queries.items():
+            pools[name] = [tuple(row) for row in conn.exec_driver_sql(
+                f"{sql} ORDER BY md5({key} || '{int(seed)}'), {key} LIMIT {int(sample_size)}")]
+    return pools
+
+def build_scenarios(pools):
+    students = pools['students']
+    professors = pools['professors']
+    projects = pools['projects']
+    skills = pools['skills']
+    departments = pools['departments']
+
+    def student_form(rng, student):
+        # Existing skills go through resolve_student_skills() as (skill, level)
+        # pairs; now and then a custom skill is created as well
+        dept = rng.choice(departments)
+        picked = rng.sample(skills, min(len(skills), rng.randint(1, 4)))
+        form = {
+            'name': student[1], 'email_addr': student[2], 'academic_level': student[3],
+            'year_of_study': student[4], 'staff_id': student[5] or '',
+            'dept_id': f"{dept[0]}|{dept[2]}",
+            'skill_ids[]': [skill[0] for skill in picked],
+            'proficiency_levels[]': [rng.choice(LEVELS) for _ in picked],
+        }
+        if rng.random() < 0.1:
+            form['new_skill_names[]'] = [f"Bench Skill {rng.randrange(100)}"]
+            form['new_skill_proficiencies[]'] = [rng.choice(LEVELS)]
+        return form
+
+    def add_student(rng):
+        n = rng.randrange(10 ** 9)
+        student = (None, f"Bench Student {n}", f"bench{n}@example.edu", 'Undergraduate', 'Junior', '')
+        return 'POST', '/students/add', student_form(rng, student)
+
+    def edit_student(rng):
+        student = rng.choice(students)
+        return 'POST', f"/students/{student[0]}/edit", student_form(rng, student)
+
+    def add_professor(rng):
+        n = rng.randrange(10 ** 9)
+        dept = rng.choice(departments)
+        return 'POST', '/professors/add', {'name': f"Bench Professor {n}", 'email': f"bench{n}@example.edu",
+                                           'research_focus': rng.choice(TOPICS),
+                                           'dept_id': f"{dept[0]}|{dept[2]}"}
+
+    def edit_professor(rng):
+        professor = rng.choice(professors)
+        dept = rng.choice(departments)
+        return 'POST', f"/professors/{professor[0]}/edit", {'name': professor[1], 'email': professor[2],
+                                                           'research_focus': professor[3],
+                                                           'dept_id': f"{dept[0]}|{dept[2]}"}
+
+    def project_form(rng, project):
+        return {'title': project[1], 'abstract': project[2], 'status': project[3],
+                'start_date': project[4].isoformat(), 'staff_id': rng.choice(professors)[0],
+                'skills': [skill[0] for skill in rng.sample(skills, 2)]}
+
+    def add_project(rng):
+        n = rng.randrange(10 ** 9)
+        project = (None, f"Bench project {n}", "Created by bench.py.", 'Open', EPOCH)
+        return 'POST', '/projects/add', project_form(rng, project)
+
+    def edit_project(rng):
+        project = rng.choice(projects)
+        return 'POST', f"/projects/{project[0]}/edit", project_form(rng, project)
+
+    def apply(rng):
+        return 'POST', f"/projects/{rng.choice(projects)[0]}/apply", {'student_id': rng.choice(students)[0]}
+
+    return [
+        ('dashboard', 10, lambda rng: ('GET', '/welcome', None)),
+        ('all_students', 8, lambda rng: ('GET', '/students', None)),
+        ('search_students', 4, lambda rng: ('GET', '/students?' + urlencode({'q': rng.choice(LAST_NAMES)}), None)),
+        ('student_profile', 12, lambda rng: ('GET', f"/students/{rng.choice(students)[0]}", None)),
+        ('all_professors', 6, lambda rng: ('GET', '/professors', None)),
+        ('professor_profile', 8, lambda rng: ('GET', f"/professors/{rng.choice(professors)[0]}", None)),
+        ('all_projects', 10, lambda rng: ('GET', '/projects', None)),
+        ('search_projects', 4, lambda rng: ('GET', '/projects?' + urlencode({'q': rng.choice(TOPICS)}), None)),
+        ('view_project', 12, lambda rng: ('GET', f"/projects/{rng.choice(projects)[0]}", None)),
+        ('add_student_form', 2, lambda rng: ('GET', '/students/add', None)),
+        ('edit_student_form', 2, lambda rng: ('GET', f"/students/{rng.choice(students)[0]}/edit", None)),
+        ('add_professor_form', 1, lambda rng: ('GET', '/professors/add', None)),
+        ('edit_professor_form', 1, lambda rng: ('GET', f"/professors/{rng.choice(professors)[0]}/edit", None)),
+        ('add_project_form', 2, lambda rng: ('GET', '/projects/add', None)),
+        ('edit_project_form', 2, lambda rng: ('GET', f"/projects/{rng.choice(projects)[0]}/edit", None)),
+        ('apply_form', 2, lambda rng: ('GET', f"/projects/{rng.choice(projects)[0]}/apply", None)),
+        ('add_student', 1, add_student),
+        ('edit_student', 2, edit_student),
+        ('add_professor', 1, add_professor),
+        ('edit_professor', 1, edit_professor),
+        ('add_project', 1, add_project),
+        ('edit_project', 2, edit_project),
+        ('apply', 4, apply),
+    ]
+
+
+#LOAD GENERATION
+QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+DB_RE = re.compile(r'(?:^|,\s*)db;dur=([\d.]+)')
+
+def send(host, port, method, path, data):
+    body, headers = None, {}
+    if data is not None:
+        body = urlencode(data, doseq=True)
+        headers['Content-Type'] = 'application/x-www-form-urlencoded'
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    try:
+        start = time.perf_counter()
+        conn.request(method, path, body, headers)
+        response = conn.getresponse()
+        response.read()
+        elapsed = time.perf_counter() - start
+    finally:
+        conn.close()
+
+    timing = response.getheader('Server-Timing') or ''
+    queries = QUERIES_RE.search(timing)
+    db = DB_RE.search(timing)
+    return (response.status, elapsed,
+            int(queries.group(1)) if queries else None,
+            float(db.group(1)) if db else None)
+
+def run_clients(host, port, scenarios, clients, duration, warmup, seed):
+    names = [name for name, _, _ in scenarios]
+    weights = [weight for _, weight, _ in scenarios]
+    makers = {name: make for name, _, make in scenarios}
+    samples = []            # (name, status, seconds, queries, db_ms)
+    samples_lock = threading.Lock()
+    measure_from = time.perf_counter() + warmup
+    deadline = measure_from + duration
+
+    def client(n):
+        rng = random.Random(seed * 1000 + n)
+        local = []
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            method, path, data = makers[name](rng)
+            started = time.perf_counter()
+            try:
+                status, elapsed, queries, db_ms = send(host, port, method, path, data)
+            except Exception:
+                status, elapsed, queries, db_ms = 'error', time.perf_counter() - started, None, None
+            if started >= measure_from:
+                local.append((name, status, elapsed, queries, db_ms))
+        with samples_lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+
+#REPORTING
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    rank = min(len(sorted_values), max(1, math.ceil(p / 100.0 * len(sorted_values)))) - 1
+    return sorted_values[rank]
+
+def summarize(samples, duration):
+    def stats(group):
+        latencies = sorted(s[2] * 1000 for s in group)
+        queries = [s[3] for s in group if s[3] is not None]
+        db = [s[4] for s in group if s[4] is not None]
+        statuses = {}
+        for s in group:
+            statuses[str(s[1])] = statuses.get(str(s[1]), 0) + 1
+        return {
+            'requests': len(group),
+            'throughput_rps': round(len(group) / duration, 2),
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'p99_ms': percentile(latencies, 99),
+            'mean_ms': sum(latencies) / len(latencies) if latencies else None,
+            'queries_per_request': sum(queries) / len(queries) if queries else None,
+            'db_ms_per_request': sum(db) / len(db) if db else None,
+            'statuses': statuses,
+        }
+
+    routes = {}
+    for sample in samples:
+        routes.setdefault(sample[0], []).append(sample)
+    return {name: stats(group) for name, group in sorted(routes.items())}, stats(samples)
+
+def dataset_counts(server):
+    with server.engine.connect() as conn:
+        return {table: conn.exec_driver_sql(f"SELECT COUNT(*) FROM {table}").scalar()
+                for table in ['Student', 'Professor', 'Project', 'Skill', 'Applies_To_Project', 'Has_Skill']}
+
+def git_commit():
+    root = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=root, text=True).strip()
+        dirty = subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                        cwd=root, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return commit + ('-dirty' if dirty else '')
+
+def print_report(routes, overall):
+    def fmt(value, spec='.1f'):
+        return '-' if value is None else format(value, spec)
+
+    header = f"{'route':<22}{'reqs':>8}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'queries':>9}{'db ms':>9}"
+    print(header)
+    print('-' * len(header))
+    for name, r in list(routes.items()) + [('TOTAL', overall)]:
+        print(f"{name:<22}{r['requests']:>8}{fmt(r['throughput_rps']):>9}{fmt(r['p50_ms']):>9}"
+              f"{fmt(r['p95_ms']):>9}{fmt(r['p99_ms']):>9}{fmt(r['queries_per_request']):>9}"
+              f"{fmt(r['db_ms_per_request']):>9}")
+
+
+@click.command()
+@click.argument('DATABASE_URL')
+@click.option('--drop-existing', is_flag=True, help='Confirm that the tables in DATABASE_URL may be dropped.')
+@click.option('--students', default=2000, help='Synthetic students to seed.')
+@click.option('--professors', default=200, help='Synthetic professors to seed.')
+@click.option('--projects', default=1000, help='Synthetic projects to seed.')
+@click.option('--skills', default=30, help='Distinct skill names (each seeded at three levels).')
+@click.option('--applications', default=5, help='Average applications per student.')
+@click.option('--seed', default=4111, help='Random seed for data and request mix.')
+@click.option('--skip-seed', is_flag=True, help='Reuse the data already in the database.')
+@click.option('--clients', default=8, help='Concurrent clients.')
+@click.option('--duration', default=20.0, help='Measured seconds of load.')
+@click.option('--warmup', default=3.0, help='Seconds of load before measuring.')
+@click.option('--output', default='bench-results', help='Directory for the JSON results.')
+def bench(database_url, drop_existing, students, professors, projects, skills, applications, seed,
+          skip_seed, clients, duration, warmup, output):
+    """Seed DATABASE_URL with synthetic data and load-test every route of server.py."""
+    if not skip_seed:
+        check_target(database_url, drop_existing)
+    os.environ.setdefault('SERVER_TIMING', '1')
+    server = import_server(database_url)
+    from werkzeug.serving import make_server
+
+    if not skip_seed:
+        dataset = SyntheticDataset(students, professors, projects, skills, applications, seed=seed)
+        started = time.perf_counter()
+        counts = load(server, dataset)
+        print(f"seeded in {time.perf_counter() - started:.1f}s: " +
+              ", ".join(f"{table} {count}" for table, count in counts.items()))
+    pools = load_scenario_pools(server, seed)
+
+    httpd = make_server('127.0.0.1', 0, server.app, threaded=True)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        samples = run_clients('127.0.0.1', httpd.server_port, build_scenarios(pools),
+                              clients, duration, warmup, seed)
+    finally:
+        httpd.shutdown()
+
+    routes, overall = summarize(samples, duration)
+    print_report(routes, overall)
+
+    commit = git_commit()
+    result = {
+        'commit': commit,
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'config': {'clients': clients, 'duration': duration, 'warmup': warmup, 'seed': seed,
+                   'pool': {k: os.environ.get(k) for k in ('DB_POOL', 'DB_POOL_SIZE', 'DB_MAX_OVERFLOW')}},
+        'dataset': dataset_counts(server),
+        'routes': routes,
+        'overall': overall,
+    }
+    os.makedirs(output, exist_ok=True)
+    path = os.path.join(output, f"{commit[:12]}-{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(path, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f"results written to {path}")
+
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,286 @@
+"""
+Synthetic data generator for large-scale testing.
+
+    python datagen.py postgresql://localhost/research_scale --drop-existing --students 1000000
+
+Drops and recreates the schema (sql/schema.sql), then streams a deterministic
+Student / Professor / Project / Skill / Department graph into it with
+PostgreSQL COPY. Ids follow the conventions of the add routes (S001, P001,
+PRJ001, SK001). Rows are produced lazily and fed to COPY through a file-like
+reader, so memory stays flat however many rows are generated. The sequence,
+counter and index scripts run after the load, since they seed themselves from
+the loaded rows.
+"""
+import os
+import io
+import sys
+import time
+import random
+import datetime
+
+import click
+
+
+TABLES = ['Applies_To_Project', 'Requires_Skill', 'Has_Skill', 'Leads_Project', 'Part_Of',
+          'Researches_At', 'Student', 'Project', 'Skill', 'Professor', 'Department', 'University']
+SEQUENCES = ['student_id_seq', 'professor_id_seq', 'project_id_seq', 'skill_id_seq']
+
+FIRST_NAMES = ['Ada', 'Alan', 'Barbara', 'Claude', 'Donald', 'Edsger', 'Frances', 'Grace', 'John',
+               'Ken', 'Leslie', 'Margaret', 'Niklaus', 'Radia', 'Shafi', 'Tim', 'Vint', 'Yann']
+LAST_NAMES = ['Allen', 'Backus', 'Codd', 'Dijkstra', 'Goldwasser', 'Hamilton', 'Hopper', 'Knuth',
+              'Lamport', 'Liskov', 'McCarthy', 'Perlman', 'Ritchie', 'Shannon', 'Thompson', 'Wirth']
+TOPICS = ['Databases', 'Distributed Systems', 'Machine Learning', 'Computer Vision', 'Compilers',
+          'Networks', 'Security', 'Robotics', 'Graphics', 'Theory', 'HCI', 'Bioinformatics']
+SKILL_NAMES = ['Python', 'SQL', 'C++', 'Java', 'Rust', 'Statistics', 'PyTorch', 'Linux', 'Go',
+               'JavaScript', 'R', 'MATLAB', 'Haskell', 'CUDA', 'Verilog', 'Docker']
+LEVELS = ['Beginner', 'Intermediate', 'Advanced']
+ACADEMIC_LEVELS = {
+    'Undergraduate': ['Freshman', 'Sophomore', 'Junior', 'Senior'],
+    'Graduate': ['First-year Graduate', 'Second-year Graduate'],
+}
+STATUSES = ['Open', 'In Progress', 'Completed']
+EPOCH = datetime.date(2025, 1, 1)  # project start dates fall in the five years before it
+DEPARTMENTS_PER_UNIVERSITY = 5
+
+
+#DATASET
+class SyntheticDataset(object):
+    """
+    A deterministic dataset of the given size. Every table is an independent
+    generator seeded from (seed, table), so tables can be streamed one at a
+    time, in foreign-key order, without holding earlier ones in memory.
+    """
+
+    def __init__(self, students=2000, professors=200, projects=1000, skills=30,
+                 applications=5, skills_per_student=6, seed=4111):
+        self.students = students
+        self.professors = max(1, professors)
+        self.projects = projects
+        self.skills = skills
+        self.applications = applications
+        self.skills_per_student = skills_per_student
+        self.seed = seed
+        self.universities = [f"University {n}" for n in range(1, max(2, professors // 50) + 2)]
+        self.departments = [(f"D{d:02d}", f"{topic} Department", university)
+                            for university in self.universities
+                            for d, topic in enumerate(TOPICS[:DEPARTMENTS_PER_UNIVERSITY], start=1)]
+        self.skill_count = skills * len(LEVELS)
+
+    def tables(self):
+        """(table, columns, row iterator) for every table, in foreign-key order"""
+        return [
+            ('University', ['university_name'], ((u,) for u in self.universities)),
+            ('Department', ['dept_id', 'dept_name', 'university_name'], iter(self.departments)),
+            ('Professor', ['staff_id', 'name', 'email_addr', 'research_focus'], self.professor_rows()),
+            ('Researches_At', ['staff_id', 'dept_id', 'university_name'], self.researches_at_rows()),
+            ('Skill', ['skill_id', 'skill_name', 'proficiency_level'], self.skill_rows()),
+            ('Student', ['student_id', 'name', 'email_addr', 'academic_level', 'year_of_study', 'staff_id'],
+             self.student_rows()),
+            ('Part_Of', ['student_id', 'dept_id', 'university_name'], self.part_of_rows()),
+            ('Has_Skill', ['student_id', 'skill_id'], self.has_skill_rows()),
+            ('Project', ['project_id', 'title', 'abstract', 'status', 'start_date'], self.project_rows()),
+            ('Leads_Project', ['staff_id', 'project_id'], self.leads_project_rows()),
+            ('Requires_Skill', ['project_id', 'skill_id'], self.requires_skill_rows()),
+            ('Applies_To_Project', ['student_id', 'project_id'], self.applies_rows()),
+        ]
+
+    def rng(self, table):
+        return random.Random(f"{self.seed}:{table}")
+
+    def person(self, rng, n):
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {n}"
+
+    def department_key(self, rng):
+        dept_id, _, university_name = rng.choice(self.departments)
+        return dept_id, university_name
+
+    def professor_rows(self):
+        rng = self.rng('Professor')
+        for n in range(1, self.professors + 1):
+            staff_id = f"P{n:03d}"
+            yield staff_id, self.person(rng, n), f"{staff_id.lower()}@example.edu", rng.choice(TOPICS)
+
+    def researches_at_rows(self):
+        rng = self.rng('Researches_At')
+        for n in range(1, self.professors + 1):
+            yield (f"P{n:03d}",) + self.department_key(rng)
+
+    def skill_rows(self):
+        names = SKILL_NAMES + [f"Skill {n}" for n in range(len(SKILL_NAMES) + 1, self.skills + 1)]
+        n = 0
+        for name in names[:self.skills]:
+            for level in LEVELS:
+                n += 1
+                yield f"SK{n:03d}", name, level
+
+    def student_rows(self):
+        rng = self.rng('Student')
+        for n in range(1, self.students + 1):
+            student_id = f"S{n:03d}"
+            level = rng.choice(list(ACADEMIC_LEVELS))
+            advisor = f"P{rng.randint(1, self.professors):03d}" if rng.random() < 0.7 else None
+            yield (student_id, self.person(rng, n), f"{student_id.lower()}@example.edu",
+                   level, rng.choice(ACADEMIC_LEVELS[level]), advisor)
+
+    def part_of_rows(self):
+        rng = self.rng('Part_Of')
+        for n in range(1, self.students + 1):
+            yield (f"S{n:03d}",) + self.department_key(rng)
+
+    def has_skill_rows(self):
+        rng = self.rng('Has_Skill')
+        for n in range(1, self.students + 1):
+            count = min(self.skill_count, rng.randint(1, self.skills_per_student))
+            for k in rng.sample(range(1, self.skill_count + 1), count):
+                yield f"S{n:03d}", f"SK{k:03d}"
+
+    def project_rows(self):
+        rng = self.rng('Project')
+        for n in range(1, self.projects + 1):
+            topic = rng.choice(TOPICS)
+            yield (f"PRJ{n:03d}", f"{topic} project {n}",
+                   f"Synthetic {topic.lower()} research project number {n}.",
+                   rng.choice(STATUSES), EPOCH - datetime.timedelta(days=rng.randint(0, 5 * 365)))
+
+    def leads_project_rows(self):
+        rng = self.rng('Leads_Project')
+        for n in range(1, self.projects + 1):
+            yield f"P{rng.randint(1, self.professors):03d}", f"PRJ{n:03d}"
+
+    def requires_skill_rows(self):
+        rng = self.rng('Requires_Skill')
+        for n in range(1, self.projects + 1):
+            for k in rng.sample(range(1, self.skill_count + 1), min(self.skill_count, rng.randint(1, 4))):
+                yield f"PRJ{n:03d}", f"SK{k:03d}"
+
+    def applies_rows(self):
+        rng = self.rng('Applies_To_Project')
+        for n in range(1, self.students + 1):
+            count = min(self.projects, rng.randint(0, 2 * self.applications))
+            for k in rng.sample(range(1, self.projects + 1), count):
+                yield f"S{n:03d}", f"PRJ{k:03d}"
+
+
+#COPY LOADING
+def copy_value(value):
+    """One field in COPY text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+class CopyReader(io.TextIOBase):
+    """
+    File-like view over a row iterator, as COPY ... FROM STDIN wants it.
+    Only the rows needed for the requested chunk are materialised.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.buffer = ''
+        self.count = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        parts, length = [self.buffer], len(self.buffer)
+        while size < 0 or length < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            line = '\t'.join(copy_value(value) for value in row) + '\n'
+            parts.append(line)
+            length += len(line)
+            self.count += 1
+        data = ''.join(parts)
+        if size < 0:
+            self.buffer = ''
+            return data
+        self.buffer = data[size:]
+        return data[:size]
+
+def copy_rows(dbapi_conn, table, columns, rows, chunk_size=1 << 20):
+    """Stream rows into table with COPY; returns the number of rows sent"""
+    reader = CopyReader(iter(rows))
+    with dbapi_conn.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", reader, size=chunk_size)
+    return reader.count
+
+def load(server, dataset, progress=None):
+    """
+    Recreate the schema in server's database and COPY dataset into it. Returns
+    {table: rows loaded}.
+    """
+    counts = {}
+    with server.engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE IF EXISTS " + ", ".join(TABLES) + " CASCADE")
+        conn.exec_driver_sql("DROP SEQUENCE IF EXISTS " + ", ".join(SEQUENCES))
+        with open(os.path.join(server.sql_dir, 'schema.sql')) as f:
+            conn.execution_options(no_parameters=True).exec_driver_sql(f.read())
+
+        dbapi_conn = conn.connection.dbapi_connection
+        for table, columns, rows in dataset.tables():
+            started = time.perf_counter()
+            counts[table] = copy_rows(dbapi_conn, table, columns, rows)
+            if progress:
+                progress(table, counts[table], time.perf_counter() - started)
+
+    # Sequences and counter columns are seeded from the loaded rows.
+    for script in ('id_sequences', 'counters', 'search_indexes'):
+        server.apply_sql_script(script)
+    server.create_missing_indexes()
+    with server.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("ANALYZE")
+    return counts
+
+def check_target(database_url, drop_existing):
+    """
+    load() drops every table, so the target must be named explicitly, the
+    caller must confirm with --drop-existing, and it may not be the database
+    the app is configured for.
+    """
+    if database_url == os.environ.get('DATABASE_URL'):
+        raise click.UsageError("refusing to drop the tables of the app's DATABASE_URL; "
+                               "use a scratch database")
+    if not drop_existing:
+        raise click.UsageError(f"this drops every table in {database_url}; "
+                               "pass --drop-existing to confirm")
+
+def import_server(database_url):
+    """server.py reads DATABASE_URL at import time"""
+    os.environ['DATABASE_URL'] = database_url
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import server
+    return server
+
+
+@click.command()
+@click.argument('DATABASE_URL')
+@click.option('--drop-existing', is_flag=True, help='Confirm that the tables in DATABASE_URL may be dropped.')
+@click.option('--students', default=100000, help='Students to generate.')
+@click.option('--professors', default=5000, help='Professors to generate.')
+@click.option('--projects', default=20000, help='Projects to generate.')
+@click.option('--skills', default=50, help='Distinct skill names (each at three levels).')
+@click.option('--applications', default=5, help='Average applications per student.')
+@click.option('--skills-per-student', default=6, help='Maximum skills per student.')
+@click.option('--seed', default=4111, help='Random seed; the same seed gives the same data.')
+def datagen(database_url, drop_existing, students, professors, projects, skills, applications,
+            skills_per_student, seed):
+    """Replace the tables in DATABASE_URL with a synthetic dataset."""
+    check_target(database_url, drop_existing)
+    server = import_server(database_url)
+    dataset = SyntheticDataset(students, professors, projects, skills, applications, skills_per_student, seed)
+
+    def progress(table, count, elapsed):
+        print(f"{table:<20}{count:>12} rows {elapsed:>8.1f}s")
+
+    started = time.perf_counter()
+    counts = load(server, dataset, progress)
+    print(f"loaded {sum(counts.values())} rows in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    datagen()
@@ -0,0 +1,107 @@
+-- Materialised counts read by the listing pages:
+--   Project.applicant_count   = rows in Applies_To_Project for the project
+--   Professor.project_count   = rows in Leads_Project for the professor
+-- Statement-level triggers keep them current, so the listings read a column
+-- instead of running a COUNT(*) sub-select for every row.
+-- Safe to run again: columns are added (and backfilled) only once.
+
+DO $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(4111009);
+
+    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                   WHERE table_name = 'project' AND column_name = 'applicant_count') THEN
+        ALTER TABLE Project ADD COLUMN applicant_count integer NOT NULL DEFAULT 0;
+        UPDATE Project p SET applicant_count = c.n
+        FROM (SELECT project_id, COUNT(*) AS n FROM Applies_To_Project GROUP BY project_id) c
+        WHERE p.project_id = c.project_id;
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                   WHERE table_name = 'professor' AND column_name = 'project_count') THEN
+        ALTER TABLE Professor ADD COLUMN project_count integer NOT NULL DEFAULT 0;
+        UPDATE Professor p SET project_count = c.n
+        FROM (SELECT staff_id, COUNT(*) AS n FROM Leads_Project GROUP BY staff_id) c
+        WHERE p.staff_id = c.staff_id;
+    END IF;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION maintain_applicant_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE Project p SET applicant_count = p.applicant_count + d.n
+        FROM (SELECT project_id, COUNT(*) AS n FROM new_rows GROUP BY project_id) d
+        WHERE p.project_id = d.project_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE Project p SET applicant_count = p.applicant_count - d.n
+        FROM (SELECT project_id, COUNT(*) AS n FROM old_rows GROUP BY project_id) d
+        WHERE p.project_id = d.project_id;
+    ELSE
+        -- Only touch projects whose count actually changed
+        UPDATE Project p SET applicant_count = p.applicant_count + d.n
+        FROM (SELECT project_id, SUM(delta) AS n
+              FROM (SELECT project_id, 1 AS delta FROM new_rows
+                    UNION ALL
+                    SELECT project_id, -1 AS delta FROM old_rows) moved
+              GROUP BY project_id
+              HAVING SUM(delta) <> 0) d
+        WHERE p.project_id = d.project_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_project_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE Professor p SET project_count = p.project_count + d.n
+        FROM (SELECT staff_id, COUNT(*) AS n FROM new_rows GROUP BY staff_id) d
+        WHERE p.staff_id = d.staff_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE Professor p SET project_count = p.project_count - d.n
+        FROM (SELECT staff_id, COUNT(*) AS n FROM old_rows GROUP BY staff_id) d
+        WHERE p.staff_id = d.staff_id;
+    ELSE
+        UPDATE Professor p SET project_count = p.project_count + d.n
+        FROM (SELECT staff_id, SUM(delta) AS n
+              FROM (SELECT staff_id, 1 AS delta FROM new_rows
+                    UNION ALL
+                    SELECT staff_id, -1 AS delta FROM old_rows) moved
+              GROUP BY staff_id
+              HAVING SUM(delta) <> 0) d
+        WHERE p.staff_id = d.staff_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(4111009);
+
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'applies_to_project_count_ins') THEN
+        CREATE TRIGGER applies_to_project_count_ins AFTER INSERT ON Applies_To_Project
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION maintain_applicant_count();
+        CREATE TRIGGER applies_to_project_count_del AFTER DELETE ON Applies_To_Project
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION maintain_applicant_count();
+        CREATE TRIGGER applies_to_project_count_upd AFTER UPDATE ON Applies_To_Project
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION maintain_applicant_count();
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'leads_project_count_ins') THEN
+        CREATE TRIGGER leads_project_count_ins AFTER INSERT ON Leads_Project
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION maintain_project_count();
+        CREATE TRIGGER leads_project_count_del AFTER DELETE ON Leads_Project
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION maintain_project_count();
+        CREATE TRIGGER leads_project_count_upd AFTER UPDATE ON Leads_Project
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION maintain_project_count();
+    END IF;
+END
+$$;
@@ -0,0 +1,41 @@
+-- Sequences behind the S### / P### / PRJ### / SK### identifiers.
+-- nextval() is O(1) and never hands the same number to two transactions,
+-- unlike reading the current maximum id and adding one.
+--
+-- Each sequence is created once, starting after the highest id already in
+-- its table, so this script is safe to run again.
+
+DO $$
+BEGIN
+    -- Serialise concurrent runs (several workers starting at once)
+    PERFORM pg_advisory_xact_lock(4111005);
+
+    IF to_regclass('student_id_seq') IS NULL THEN
+        CREATE SEQUENCE student_id_seq;
+        PERFORM setval('student_id_seq', COALESCE(
+            (SELECT max(substring(student_id FROM 2)::bigint) FROM Student
+             WHERE student_id ~ '^S[0-9]+$'), 0) + 1, false);
+    END IF;
+
+    IF to_regclass('professor_id_seq') IS NULL THEN
+        CREATE SEQUENCE professor_id_seq;
+        PERFORM setval('professor_id_seq', COALESCE(
+            (SELECT max(substring(staff_id FROM 2)::bigint) FROM Professor
+             WHERE staff_id ~ '^P[0-9]+$'), 0) + 1, false);
+    END IF;
+
+    IF to_regclass('project_id_seq') IS NULL THEN
+        CREATE SEQUENCE project_id_seq;
+        PERFORM setval('project_id_seq', COALESCE(
+            (SELECT max(regexp_replace(project_id, '[^0-9]', '', 'g')::bigint) FROM Project
+             WHERE project_id ~ '[0-9]'), 0) + 1, false);
+    END IF;
+
+    IF to_regclass('skill_id_seq') IS NULL THEN
+        CREATE SEQUENCE skill_id_seq;
+        PERFORM setval('skill_id_seq', COALESCE(
+            (SELECT max(substring(skill_id FROM 3)::bigint) FROM Skill
+             WHERE skill_id ~ '^SK[0-9]+$'), 0) + 1, false);
+    END IF;
+END
+$$;
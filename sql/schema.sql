@@ -0,0 +1,84 @@
+-- The tables server.py reads and writes, as the routes expect them.
+-- bench.py loads this into a scratch database before seeding synthetic data;
+-- the scripts next to it (id_sequences, counters, ...) build on top of it.
+
+CREATE TABLE IF NOT EXISTS University (
+    university_name text PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS Department (
+    dept_id text NOT NULL,
+    dept_name text NOT NULL,
+    university_name text NOT NULL REFERENCES University,
+    PRIMARY KEY (dept_id, university_name)
+);
+
+CREATE TABLE IF NOT EXISTS Professor (
+    staff_id text PRIMARY KEY,
+    name text NOT NULL,
+    email_addr text NOT NULL,
+    research_focus text
+);
+
+CREATE TABLE IF NOT EXISTS Student (
+    student_id text PRIMARY KEY,
+    name text NOT NULL,
+    email_addr text NOT NULL,
+    academic_level text,
+    year_of_study text,
+    staff_id text REFERENCES Professor
+);
+
+CREATE TABLE IF NOT EXISTS Project (
+    project_id text PRIMARY KEY,
+    title text NOT NULL,
+    abstract text,
+    status text,
+    start_date date
+);
+
+CREATE TABLE IF NOT EXISTS Skill (
+    skill_id text PRIMARY KEY,
+    skill_name text NOT NULL,
+    proficiency_level text NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS Leads_Project (
+    staff_id text NOT NULL REFERENCES Professor,
+    project_id text NOT NULL REFERENCES Project,
+    PRIMARY KEY (staff_id, project_id)
+);
+
+CREATE TABLE IF NOT EXISTS Applies_To_Project (
+    student_id text NOT NULL REFERENCES Student,
+    project_id text NOT NULL REFERENCES Project,
+    PRIMARY KEY (student_id, project_id)
+);
+
+CREATE TABLE IF NOT EXISTS Has_Skill (
+    student_id text NOT NULL REFERENCES Student,
+    skill_id text NOT NULL REFERENCES Skill,
+    PRIMARY KEY (student_id, skill_id)
+);
+
+CREATE TABLE IF NOT EXISTS Requires_Skill (
+    project_id text NOT NULL REFERENCES Project,
+    skill_id text NOT NULL REFERENCES Skill,
+    PRIMARY KEY (project_id, skill_id)
+);
+
+CREATE TABLE IF NOT EXISTS Part_Of (
+    student_id text NOT NULL REFERENCES Student,
+    dept_id text NOT NULL,
+    university_name text NOT NULL,
+    PRIMARY KEY (student_id, dept_id, university_name),
+    FOREIGN KEY (dept_id, university_name) REFERENCES Department
+);
+
+CREATE TABLE IF NOT EXISTS Researches_At (
+    staff_id text NOT NULL REFERENCES Professor,
+    dept_id text NOT NULL,
+    university_name text NOT NULL,
+    PRIMARY KEY (staff_id, dept_id, university_name),
+    FOREIGN KEY (dept_id, university_name) REFERENCES Department
+);
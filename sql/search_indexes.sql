@@ -0,0 +1,15 @@
+-- Trigram indexes backing the ?q= search on the listing pages.
+-- The searches use ILIKE '%term%', which a GIN index with gin_trgm_ops can
+-- answer without a sequential scan.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS student_name_trgm_idx ON Student USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS student_email_trgm_idx ON Student USING gin (email_addr gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS professor_name_trgm_idx ON Professor USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS professor_email_trgm_idx ON Professor USING gin (email_addr gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS professor_research_focus_trgm_idx ON Professor USING gin (research_focus gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS project_title_trgm_idx ON Project USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS project_abstract_trgm_idx ON Project USING gin (abstract gin_trgm_ops);